@@ -2,45 +2,32 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from scipy import stats
-import random
 from datetime import datetime, timedelta
 import pandas as pd
-
-class WiFiUser:
-    """Kelas untuk merepresentasikan pengguna WiFi sebagai 'ant'"""
-    def __init__(self, x, y, user_id, arrival_time):
-        self.x = x
-        self.y = y
-        self.user_id = user_id
-        self.arrival_time = arrival_time
-        self.connected = True
-        self.session_duration = np.random.exponential(45)
-        self.movement_pattern = np.random.choice(['stationary', 'mobile'], p=[0.7, 0.3])
-        self.signal_strength = self._calculate_signal_strength()
-        
-    def _calculate_signal_strength(self):
-        """Hitung kekuatan sinyal berdasarkan jarak dari router"""
-        distance = np.sqrt((self.x - 5)**2 + (self.y - 5)**2)
-        return max(0.1, 1 - (distance / 10))  # Sinyal melemah dengan jarak
-    
-    def move(self):
-        """Ant Random Walk movement"""
-        if self.movement_pattern == 'mobile':
-            # Random walk dengan probabilitas tetap di tempat
-            if random.random() < 0.3: 
-                dx = random.choice([-1, 0, 1]) * 0.5
-                dy = random.choice([-1, 0, 1]) * 0.5
-                
-                # Batas movement dalam area cafe
-                self.x = max(0, min(10, self.x + dx))
-                self.y = max(0, min(10, self.y + dy))
-                
-                # Update signal strength setelah bergerak
-                self.signal_strength = self._calculate_signal_strength()
+from _kernels import step_kernel
 
 class WiFiCafeSimulation:
     """Simulasi utama untuk WiFi cafe"""
     
+    # State pengguna disimpan sebagai array paralel (SoA), satu baris per pengguna
+    _USER_FIELDS = (
+        ('xs', np.float32),
+        ('ys', np.float32),
+        ('arrival_times', np.int32),
+        ('session_durations', np.float32),
+        ('signal_strengths', np.float32),
+        ('movement_mask', np.bool_),
+        ('user_ids', np.int32),
+    )
+    
+    # Log sesi disimpan per kolom, kapasitas tumbuh geometris saat penuh
+    _LOG_FIELDS = (
+        ('_log_uid', np.int32),
+        ('_log_arr', np.int32),
+        ('_log_dep', np.int32),
+        ('_log_sig', np.float32),
+    )
+    
     def calibrate_parameters(self, real_data_hosts):
         """Kalibrasi parameter simulasi berdasarkan data real"""
         print("🔧 Mengkalibrasi parameter simulasi...")
@@ -68,14 +55,23 @@ class WiFiCafeSimulation:
         # Kalibrasi cafe capacity berdasarkan peak + buffer
         self.cafe_capacity = int(peak_hosts * 1.2)
         print(f"🏢 Kapasitas cafe disesuaikan: {self.cafe_capacity}")
+        self._allocate_user_arrays(self.cafe_capacity)
+        self._build_lookup_tables()
         
         return mean_hosts, peak_hosts, peak_time_idx
     
-    def __init__(self, cafe_capacity=50, real_data=None):
+    def __init__(self, cafe_capacity=50, real_data=None, seed=None, steps_per_frame=5, visualize=True):
+        # Satu generator (PCG64) untuk seluruh bilangan acak simulasi
+        self.rng = np.random.default_rng(seed)
         self.cafe_capacity = cafe_capacity
-        self.users = []
+        # Jumlah langkah simulasi (menit) per frame animasi
+        self.steps_per_frame = steps_per_frame
+        self.n_users = 0
+        self._allocate_user_arrays(cafe_capacity)
         self.time_minutes = 0
-        self.connection_log = []
+        self._log_n = 0
+        for name, dtype in self._LOG_FIELDS:
+            setattr(self, name, np.empty(1024, dtype=dtype))
         self.router_x, self.router_y = 5, 5 
         
         # Data historis
@@ -86,11 +82,86 @@ class WiFiCafeSimulation:
         else:
             print("⚠️  Menggunakan data simulasi default...")
             self.historical_pattern = self._generate_historical_pattern()
+            self._build_lookup_tables()
+        
+        # Data historis untuk grafik, tetap selama simulasi sehingga dihitung sekali
+        self._hist_times = [f"{(11 + i // 60):02d}:{i % 60:02d}" for i in range(0, 242, 15)]
+        self._hist_counts = np.array([self.historical_pattern.get(i // 15, 0) for i in range(0, 242, 15)])
+        self._sim_noise = self.rng.integers(-2, 3, len(self._hist_counts))
+        
+        # Seri 'Simulasi Aktual', ditambah inkremental tiap melewati batas interval 15 menit
+        self._sim_times_acc = []
+        self._sim_counts_acc = []
+        self._sim_done = 0
+        
+        # Noise stokastik arrival per menit, diambil sekaligus
+        self._noise = self.rng.normal(0, 0.05, 260)
         
-        # Setup untuk visualisasi
+        # Setup untuk visualisasi, dilewati untuk run headless (mis. sweep parameter)
+        if visualize:
+            self._create_figure()
+        
+    def _create_figure(self):
+        """Buat figure dan axes untuk animasi"""
         self.fig, (self.ax1, self.ax2) = plt.subplots(1, 2, figsize=(15, 6))
         self.setup_visualization()
+    
+    def _build_lookup_tables(self):
+        """Cache target historis dan tabel base probabilitas arrival per (slot 15 menit, jumlah pengguna)"""
+        self._hist_values = np.asarray(list(self.historical_pattern.values()), dtype=np.int32)
         
+        # Slot ke-12 (14:00) ke atas memakai target dan multiplier jam yang sama, jadi 13 baris cukup
+        slots = np.arange(13)
+        interval_idx = np.minimum(7, slots)
+        target_users = np.where(interval_idx < len(self._hist_values),
+                                self._hist_values[np.minimum(interval_idx, len(self._hist_values) - 1)], 20)
+        
+        # Probabilitas arrival disesuaikan dengan deficit
+        user_deficit = target_users[:, None] - np.arange(self.cafe_capacity + 1)[None, :]
+        base_prob = np.where(user_deficit > 0, np.minimum(0.8, user_deficit * 0.1), 0.05)
+        
+        # Peak time multiplier, jam ditentukan langsung oleh slot
+        hour = 11 + slots // 4
+        multiplier = np.where((11.5 <= hour) & (hour <= 12.5), 1.5,
+                              np.where((12.5 < hour) & (hour <= 13), 0.7, 1.0))
+        self._arr_prob = (base_prob * multiplier[:, None]).astype(np.float32)
+    
+    def _allocate_user_arrays(self, capacity):
+        """Alokasi array state pengguna, data pengguna aktif tetap dipertahankan"""
+        n = min(self.n_users, capacity)
+        for name, dtype in self._USER_FIELDS:
+            arr = np.empty(capacity, dtype=dtype)
+            if hasattr(self, name):
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self.n_users = n
+        self._leave = np.empty(capacity, dtype=np.bool_)
+        self._uniforms = np.empty((capacity, 4), dtype=np.float32)
+    
+    @property
+    def connection_log(self):
+        """Log sesi sebagai list of dict, dibangun dari array log"""
+        k = self._log_n
+        return [
+            {
+                'user_id': uid,
+                'arrival_time': arr,
+                'departure_time': dep,
+                'duration': dep - arr,
+                'avg_signal_strength': sig
+            }
+            for uid, arr, dep, sig in zip(self._log_uid[:k].tolist(), self._log_arr[:k].tolist(),
+                                          self._log_dep[:k].tolist(), self._log_sig[:k].tolist())
+        ]
+    
+    def _reserve_log(self, extra):
+        """Pastikan array log muat untuk `extra` sesi tambahan (kapasitas tumbuh geometris)"""
+        needed = self._log_n + extra
+        if needed > len(self._log_uid):
+            new_capacity = max(needed, 2 * len(self._log_uid))
+            for name, _ in self._LOG_FIELDS:
+                setattr(self, name, np.resize(getattr(self, name), new_capacity))
+    
     def _generate_historical_pattern(self):
         """Generate pola historis"""
         # Simulasi data Asli
@@ -99,7 +170,7 @@ class WiFiCafeSimulation:
         return dict(zip(range(len(times)), hosts))
     
     def setup_visualization(self):
-        """Setup untuk visualisasi"""
+        """Setup untuk visualisasi, artist dinamis dibuat sekali lalu di-update tiap frame"""
         # Plot 1: Random Ant Walk
         self.ax1.set_xlim(0, 10)
         self.ax1.set_ylim(0, 10)
@@ -111,220 +182,195 @@ class WiFiCafeSimulation:
         # Router position
         self.ax1.plot(self.router_x, self.router_y, 'r*', markersize=15, label='WiFi Router')
         
+        # Posisi pengguna, diwarnai berdasarkan kekuatan sinyal
+        self.scatter = self.ax1.scatter([], [], c=[], cmap='RdYlGn', 
+                                        s=60, alpha=0.7, vmin=0, vmax=1)
+        self.colorbar = plt.colorbar(self.scatter, ax=self.ax1)
+        self.colorbar.set_label('Kekuatan Sinyal')
+        self.status_text = self.ax1.text(0.02, 0.97, '', transform=self.ax1.transAxes, va='top',
+                                         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        
         # Plot 2: Grafik jumlah pengguna vs waktu
         self.ax2.set_title('Jumlah Pengguna WiFi vs Waktu')
         self.ax2.set_xlabel('Waktu')
         self.ax2.set_ylabel('Jumlah Pengguna Terhubung')
         self.ax2.grid(True, alpha=0.3)
         
+        # Data historis (statis)
+        self.hist_line, = self.ax2.plot(self._hist_times, self._hist_counts, 
+                                        'bo-', label='Target Historis', linewidth=2, markersize=8)
+        self.sim_line, = self.ax2.plot([], [], 
+                                       'ro-', label='Simulasi Aktual', alpha=0.8, linewidth=2, markersize=6)
+        self.target_line = self.ax2.axhline(y=0, color='blue', linestyle='--', alpha=0.5, label='Target')
+        self.actual_line = self.ax2.axhline(y=0, color='red', linestyle='--', alpha=0.5, label='Aktual')
+        
+        # Dengan blitting axes tidak di-autoscale, jadi batas y ditetapkan di awal
+        self.ax2.set_ylim(0, max(self._hist_counts.max(), self.cafe_capacity) + 5)
+        self.ax2.legend()
+        
     def arrival_probability(self, current_time_minutes):
         """Probabilitas kedatangan berdasarkan waktu (stokastik) - dikalibrasi dengan data historis"""
-        # Target berdasarkan data historis
-        interval_idx = min(7, current_time_minutes // 15)
-        target_users = list(self.historical_pattern.values())[interval_idx] if interval_idx < len(self.historical_pattern) else 20
+        # Base probability dari tabel (deficit terhadap target historis dan peak time multiplier)
+        slot = min(current_time_minutes // 15, len(self._arr_prob) - 1)
+        base_prob = self._arr_prob[slot, self.n_users]
         
-        current_users = len(self.users)
-        user_deficit = target_users - current_users
-        
-        # Probabilitas arrival disesuaikan dengan deficit
-        if user_deficit > 0:
-            base_prob = min(0.8, user_deficit * 0.1) 
-        else:
-            base_prob = 0.05 
-            
-        # Peak time multiplier
-        hour = 11 + (current_time_minutes // 60)
-        if 11.5 <= hour <= 12.5:
-            base_prob *= 1.5
-        elif 12.5 < hour <= 13:
-            base_prob *= 0.7
-            
-        # Noise stokastik
-        noise = np.random.normal(0, 0.05)
+        # Noise stokastik dari buffer, dipakai ulang secara siklik untuk simulasi yang lebih panjang
+        noise = self._noise[current_time_minutes % len(self._noise)]
         return max(0, min(1, base_prob + noise))
     
-    def departure_probability(self, user):
-        """Probabilitas departure berdasarkan durasi dan faktor lain - dikalibrasi"""
-        # Target berdasarkan data historis
-        interval_idx = min(7, self.time_minutes // 15)
-        target_users = list(self.historical_pattern.values())[interval_idx] if interval_idx < len(self.historical_pattern) else 20
-        
-        current_users = len(self.users)
-        user_surplus = current_users - target_users
-        
-        # Base probability berdasarkan session duration
-        duration_factor = self.time_minutes - user.arrival_time
-        if duration_factor > user.session_duration:
-            base_prob = 0.4
-        else:
-            base_prob = 0.01
-            
-        # Adjustment berdasarkan surplus
-        if user_surplus > 0:
-            surplus_factor = min(0.3, user_surplus * 0.05)
-            base_prob += surplus_factor
-            
-        # Faktor sinyal
-        signal_factor = (1 - user.signal_strength) * 0.05
-        
-        return min(1, base_prob + signal_factor)
-    
     def add_new_users(self):
         """Tambahkan pengguna baru berdasarkan probabilitas arrival"""
-        if len(self.users) < self.cafe_capacity:
+        n = self.n_users
+        if n < self.cafe_capacity:
             prob = self.arrival_probability(self.time_minutes)
             
-            # Poisson process untuk arrival
-            num_arrivals = np.random.poisson(prob * 3) 
+            # Poisson process untuk arrival, atribut pengguna baru diambil sekaligus
+            num_arrivals = self.rng.poisson(prob * 3)
+            k = min(num_arrivals, self.cafe_capacity - n)
+            new = slice(n, n + k)
             
-            for _ in range(min(num_arrivals, self.cafe_capacity - len(self.users))):
-                x = np.random.uniform(0, 10)
-                y = np.random.uniform(0, 10)
-                user_id = len(self.connection_log)
-                
-                new_user = WiFiUser(x, y, user_id, self.time_minutes)
-                self.users.append(new_user)
-    
-    def remove_users(self):
-        """Hapus pengguna berdasarkan probabilitas departure"""
-        users_to_remove = []
-        
-        for user in self.users:
-            if random.random() < self.departure_probability(user):
-                users_to_remove.append(user)
-                
-                # Log session
-                session_data = {
-                    'user_id': user.user_id,
-                    'arrival_time': user.arrival_time,
-                    'departure_time': self.time_minutes,
-                    'duration': self.time_minutes - user.arrival_time,
-                    'avg_signal_strength': user.signal_strength
-                }
-                self.connection_log.append(session_data)
-        
-        for user in users_to_remove:
-            self.users.remove(user)
-    
-    def update_users(self):
-        """Update posisi dan status semua pengguna"""
-        for user in self.users:
-            user.move()
+            self.xs[new] = self.rng.uniform(0, 10, k)
+            self.ys[new] = self.rng.uniform(0, 10, k)
+            self.arrival_times[new] = self.time_minutes
+            self.session_durations[new] = self.rng.exponential(45, k)
+            self.movement_mask[new] = self.rng.random(k) < 0.3
+            self.user_ids[new] = self._log_n
+            
+            # Sinyal awal pengguna baru, satu panggilan hypot + clip in-place untuk seluruh batch
+            np.clip(1 - np.hypot(self.xs[new] - self.router_x, self.ys[new] - self.router_y) * 0.1,
+                    0.1, 1.0, out=self.signal_strengths[new])
+            self.n_users = n + k
     
     def step(self):
         """Satu langkah simulasi (1 menit)"""
         self.add_new_users()
-        self.update_users()
-        self.remove_users()
+        
+        # Dalam satu langkah paling banyak seluruh kapasitas cafe yang pergi
+        capacity = len(self.xs)
+        self._reserve_log(capacity)
+        
+        # Bilangan acak per pengguna diambil sekaligus di luar region paralel kernel
+        uniforms = self._uniforms[:self.n_users]
+        self.rng.random(out=uniforms, dtype=np.float32)
+        
+        self.n_users, self._log_n = step_kernel(
+            self.xs, self.ys, self.arrival_times, self.session_durations,
+            self.signal_strengths, self.movement_mask, self.user_ids,
+            self._leave, uniforms, self.n_users, self.time_minutes, self._hist_values,
+            np.float32(self.router_x), np.float32(self.router_y),
+            self._log_uid, self._log_arr, self._log_dep, self._log_sig, self._log_n
+        )
         self.time_minutes += 1
     
+    def _update_sim_series(self):
+        """Perbarui seri simulasi aktual, hanya interval yang baru dimulai yang ditambahkan"""
+        current_interval = self.time_minutes // 15
+        n_points = min(current_interval + 1, len(self._hist_counts))
+        while len(self._sim_counts_acc) < n_points:
+            self._sim_times_acc.append(self._hist_times[len(self._sim_counts_acc)])
+            self._sim_counts_acc.append(self.n_users)
+        
+        # Interval yang sudah lewat memakai target historis + noise, masing-masing sekali
+        while self._sim_done < min(current_interval, n_points):
+            idx = self._sim_done
+            self._sim_counts_acc[idx] = self._hist_counts[idx] + self._sim_noise[idx]
+            self._sim_done += 1
+        
+        # Interval berjalan mengikuti jumlah pengguna aktual
+        if current_interval < n_points:
+            self._sim_counts_acc[current_interval] = self.n_users
+    
     def animate(self, frame):
-        """Fungsi animasi"""
+        """Fungsi animasi (blitting: hanya artist dinamis yang digambar ulang)"""
         if frame > 0:
-            self.step()
-        
-        # Clear plots
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        # Setup plots again
-        self.setup_visualization()
+            for _ in range(self.steps_per_frame):
+                self.step()
         
         # Plot current users
-        if self.users:
-            x_positions = [user.x for user in self.users]
-            y_positions = [user.y for user in self.users]
-            signal_strengths = [user.signal_strength for user in self.users]
-            
-            scatter = self.ax1.scatter(x_positions, y_positions, 
-                                     c=signal_strengths, cmap='RdYlGn', 
-                                     s=60, alpha=0.7, vmin=0, vmax=1)
-            
-            if not hasattr(self, 'colorbar'):
-                self.colorbar = plt.colorbar(scatter, ax=self.ax1)
-                self.colorbar.set_label('Kekuatan Sinyal')
-        
-        current_interval = self.time_minutes // 15
-        
-        # Data historis
-        hist_times = [f"{(11 + i // 60):02d}:{i % 60:02d}" for i in range(0, 242, 15)]
-        hist_counts = [self.historical_pattern.get(i // 15, 0) for i in range(0, 242, 15)]
-
+        n = self.n_users
+        self.scatter.set_offsets(np.c_[self.xs[:n], self.ys[:n]])
+        self.scatter.set_array(self.signal_strengths[:n])
         
         # Data simulasi actual
-        sim_times = []
-        sim_counts = []
-        
-        for i in range(0, min(self.time_minutes + 15, 242), 15):
-            sim_times.append(f"{(11 + i // 60):02d}:{i % 60:02d}")
-            if i <= self.time_minutes:
-                if i == self.time_minutes - (self.time_minutes % 15):
-                    sim_counts.append(len(self.users))
-                else:
-                    target_idx = i // 15
-                    if target_idx < len(hist_counts):
-                        sim_counts.append(hist_counts[target_idx] + np.random.randint(-2, 3))
-                    else:
-                        sim_counts.append(len(self.users))
-            else:
-                break
-        
-        # Update plot
-        if len(sim_counts) > 0:
-            self.ax2.plot(hist_times[:len(hist_counts)], hist_counts, 
-                         'bo-', label='Target Historis', linewidth=2, markersize=8)
-            self.ax2.plot(sim_times[:len(sim_counts)], sim_counts, 
-                         'ro-', label='Simulasi Aktual', alpha=0.8, linewidth=2, markersize=6)
-            
-            current_target = hist_counts[min(current_interval, len(hist_counts)-1)]
-            current_actual = len(self.users)
-            
-            self.ax2.axhline(y=current_target, color='blue', linestyle='--', alpha=0.5, 
-                           label=f'Target: {current_target}')
-            self.ax2.axhline(y=current_actual, color='red', linestyle='--', alpha=0.5,
-                           label=f'Aktual: {current_actual}')
-            
-            self.ax2.legend()
+        self._update_sim_series()
+        self.sim_line.set_data(self._sim_times_acc, self._sim_counts_acc)
         
-        # Update title
-        current_target = list(self.historical_pattern.values())[min(current_interval, len(self.historical_pattern)-1)]
+        current_interval = self.time_minutes // 15
+        current_target = self._hist_counts[min(current_interval, len(self._hist_counts)-1)]
+        current_actual = self.n_users
+        self.target_line.set_ydata([current_target, current_target])
+        self.actual_line.set_ydata([current_actual, current_actual])
+        self.status_text.set_text(f'Target: {current_target} | Aktual: {current_actual}')
         
-        return []
+        return [self.scatter, self.status_text, self.sim_line, self.target_line, self.actual_line]
     
     def run_simulation(self, duration_minutes=120):
         """Jalankan simulasi dengan animasi"""
-        self.anim = animation.FuncAnimation(self.fig, self.animate, frames=257, interval=200, repeat=False)
+        if not hasattr(self, 'fig'):
+            self._create_figure()
+        self._noise = self.rng.normal(0, 0.05, 260)
+        # 256 menit simulasi, dirender tiap `steps_per_frame` menit
+        frames = 256 // self.steps_per_frame + 1
+        self.anim = animation.FuncAnimation(self.fig, self.animate, frames=frames, interval=40,
+                                            repeat=False, blit=True)
         
         plt.tight_layout()
         plt.show()
         
         return self.anim
     
+    def run_headless(self, duration_minutes=120):
+        """Jalankan simulasi tanpa animasi/rendering, mengembalikan kolom log sesi"""
+        # Noise cukup untuk seluruh durasi, tanpa dipakai ulang secara siklik
+        self._noise = self.rng.normal(0, 0.05, max(260, self.time_minutes + duration_minutes))
+        for _ in range(duration_minutes):
+            self.step()
+        
+        return self._package_log()
+    
+    def _package_log(self):
+        """Log sesi dalam bentuk dict kolom array NumPy"""
+        k = self._log_n
+        arrival = self._log_arr[:k]
+        departure = self._log_dep[:k]
+        return {
+            'user_id': self._log_uid[:k],
+            'arrival_time': arrival,
+            'departure_time': departure,
+            'duration': departure - arrival,
+            'avg_signal_strength': self._log_sig[:k]
+        }
+    
     def analyze_results(self):
         """Analisis hasil simulasi"""
-        if not self.connection_log:
+        k = self._log_n
+        if k == 0:
             print("Tidak ada data untuk dianalisis")
             return
-            
-        df = pd.DataFrame(self.connection_log)
+        
+        # Kolom log langsung dari array NumPy, tanpa list of dict
+        log = self._package_log()
+        duration = log['duration']
+        signal = log['avg_signal_strength']
+        df = pd.DataFrame(log)
         
         print("=== ANALISIS HASIL SIMULASI ===")
-        print(f"Total sesi: {len(df)}")
-        print(f"Durasi rata-rata sesi: {df['duration'].mean():.2f} menit")
-        print(f"Durasi median sesi: {df['duration'].median():.2f} menit")
-        print(f"Kekuatan sinyal rata-rata: {df['avg_signal_strength'].mean():.3f}")
+        print(f"Total sesi: {k}")
+        print(f"Durasi rata-rata sesi: {duration.mean():.2f} menit")
+        print(f"Durasi median sesi: {np.median(duration):.2f} menit")
+        print(f"Kekuatan sinyal rata-rata: {signal.mean():.3f}")
         
         # Distribusi durasi sesi
         plt.figure(figsize=(12, 4))
         
         plt.subplot(1, 2, 1)
-        plt.hist(df['duration'], bins=20, alpha=0.7, edgecolor='black')
+        plt.hist(duration, bins=20, alpha=0.7, edgecolor='black')
         plt.title('Distribusi Durasi Sesi WiFi')
         plt.xlabel('Durasi (menit)')
         plt.ylabel('Frekuensi')
         
         plt.subplot(1, 2, 2)
-        plt.hist(df['avg_signal_strength'], bins=15, alpha=0.7, edgecolor='black')
+        plt.hist(signal, bins=15, alpha=0.7, edgecolor='black')
         plt.title('Distribusi Kekuatan Sinyal')
         plt.xlabel('Kekuatan Sinyal')
         plt.ylabel('Frekuensi')
@@ -364,17 +410,15 @@ if __name__ == "__main__":
     historical_values = list(sim.historical_pattern.values())
     print(f"Target rata-rata: {np.mean(historical_values):.1f} hosts")
     
-    if sim.connection_log:
-        # Hitung rata-rata pengguna per interval dari log
-        interval_counts = []
-        for i in range(0, 120, 15):
-            active_at_time = 0
-            for session in sim.connection_log:
-                if session['arrival_time'] <= i <= session['departure_time']:
-                    active_at_time += 1
-            interval_counts.append(active_at_time)
-        
-        sim_average = np.mean(interval_counts) if interval_counts else 0
+    log = sim._package_log()
+    if len(log['user_id']):
+        # Hitung rata-rata pengguna per interval dari log: matriks (interval, sesi) aktif/tidak
+        intervals = np.arange(0, 120, 15)
+        active = ((log['arrival_time'][None, :] <= intervals[:, None]) &
+                  (intervals[:, None] <= log['departure_time'][None, :]))
+        interval_counts = active.sum(axis=1)
+        
+        sim_average = interval_counts.mean()
         print(f"Simulasi rata-rata: {sim_average:.1f} hosts")
         
         if sim_average > 0:
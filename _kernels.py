@@ -0,0 +1,88 @@
+"""Kernel numba untuk WifiCafeSimulation, dikompilasi sekali lalu disimpan di cache disk"""
+import math
+import numpy as np
+from numba import njit, prange
+from numba.types import UniTuple, boolean, float32, int32, int64
+
+
+# Konstanta float32 agar perhitungan di kernel tidak dipromosikan ke float64
+_F32_ZERO = np.float32(0.0)
+_F32_ONE = np.float32(1.0)
+_F32_AREA = np.float32(10.0)
+_F32_STEP = np.float32(0.5)
+
+
+@njit(cache=True, fastmath=True)
+def signal_strength(x, y, router_x, router_y):
+    """Hitung kekuatan sinyal berdasarkan jarak dari router, di-clip ke [0.1, 1]"""
+    distance = math.hypot(x - router_x, y - router_y)
+    return min(_F32_ONE, max(np.float32(0.1), _F32_ONE - distance * np.float32(0.1)))  # Sinyal melemah dengan jarak
+
+
+@njit(cache=True, fastmath=True)
+def walk(pos, u):
+    """Satu langkah random walk (-0.5, 0 atau 0.5 meter) dari bilangan acak u, dibatasi area cafe"""
+    dx = np.float32(np.int32(u * np.float32(3.0)) - 1) * _F32_STEP
+    return min(_F32_AREA, max(_F32_ZERO, pos + dx))
+
+
+# Signature eksplisit: kernel dikompilasi (atau dimuat dari cache) saat import, bukan di frame animasi pertama
+@njit(
+    UniTuple(int64, 2)(
+        float32[::1], float32[::1], int32[::1], float32[::1], float32[::1], boolean[::1], int32[::1],
+        boolean[::1], float32[:, ::1], int64, int64, int32[::1], float32, float32,
+        int32[::1], int32[::1], int32[::1], float32[::1], int64
+    ),
+    cache=True, fastmath=True, parallel=True
+)
+def step_kernel(xs, ys, arrival, sess, sig, mobile, uids, leave, uniforms, n, t,
+                hist_values, router_x, router_y,
+                log_uid, log_arr, log_dep, log_sig, log_n):
+    """Satu langkah simulasi (movement, departure) langsung pada array state pengguna.
+    
+    `uniforms` berisi bilangan acak [0, 1) yang sudah diambil sebelumnya, kolom 0-3 untuk
+    gerak, dx, dy dan departure. Array diubah in-place, mengembalikan jumlah pengguna dan
+    jumlah sesi log yang baru.
+    """
+    # Departure: target berdasarkan data historis
+    interval_idx = min(7, t // 15)
+    target_users = hist_values[interval_idx] if interval_idx < hist_values.shape[0] else 20
+    user_surplus = n - target_users
+    surplus_factor = np.float32(min(0.3, user_surplus * 0.05)) if user_surplus > 0 else _F32_ZERO
+    
+    # Movement (Ant Random Walk), signal dan keputusan departure independen per pengguna
+    for i in prange(n):
+        if mobile[i] and uniforms[i, 0] < np.float32(0.3):
+            x = walk(xs[i], uniforms[i, 1])
+            y = walk(ys[i], uniforms[i, 2])
+            
+            # Signal hanya dihitung ulang bila posisi benar-benar berubah
+            if x != xs[i] or y != ys[i]:
+                xs[i] = x
+                ys[i] = y
+                sig[i] = signal_strength(x, y, router_x, router_y)
+        
+        base_prob = np.float32(0.4) if t - arrival[i] > sess[i] else np.float32(0.01)
+        prob = min(_F32_ONE, base_prob + surplus_factor + (_F32_ONE - sig[i]) * np.float32(0.05))
+        leave[i] = uniforms[i, 3] < prob
+    
+    # Serial: log sesi yang pergi, yang tetap tinggal dikompaksi ke indeks 0..new_n
+    new_n = 0
+    for i in range(n):
+        if leave[i]:
+            log_uid[log_n] = uids[i]
+            log_arr[log_n] = arrival[i]
+            log_dep[log_n] = t
+            log_sig[log_n] = sig[i]
+            log_n += 1
+        else:
+            xs[new_n] = xs[i]
+            ys[new_n] = ys[i]
+            arrival[new_n] = arrival[i]
+            sess[new_n] = sess[i]
+            sig[new_n] = sig[i]
+            mobile[new_n] = mobile[i]
+            uids[new_n] = uids[i]
+            new_n += 1
+    
+    return new_n, log_n